@@ -1,13 +1,55 @@
 #!/usr/bin/env python3
 import argparse
 import fnmatch
+import gzip
+import io
 import os
+import re
 import sys
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
+import requests_cache
 from dateutil.relativedelta import relativedelta
-from usp.fetch_parse import SitemapFetcher
+from lxml import etree
+
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # pure Python fallback, slower on large sitemaps
+
+    def parse_iso_datetime(text: str) -> datetime:
+        return datetime.fromisoformat(text)
+
+
+try:
+    import ahocorasick
+except ImportError:  # filters fall back to a regex alternation
+    ahocorasick = None
+
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+NEWS_NS = "{http://www.google.com/schemas/sitemap-news/0.9}"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Elements carrying a single entry: sitemap <url>, sitemap index <sitemap>, RSS <item>, Atom <entry>
+FEED_TAGS = (SITEMAP_NS + "url", SITEMAP_NS + "sitemap", "item", ATOM_NS + "entry")
+
+# How deep nested sitemap indexes are followed (same limit as ultimate-sitemap-parser)
+MAX_SITEMAP_DEPTH = 11
+
+SESSION = requests.Session()
+
+# Set once a feed with an ETag/Last-Modified is downloaded rather than served from the
+# cache, i.e. when the persistent cache holds something worth saving
+HTTP_CACHE_UPDATED = False
+
+# Above this many --filter-urls substrings, match them with Aho-Corasick
+AHOCORASICK_MIN_FILTERS = 8
+
+# Exclude globs that can be checked without a regex
+_LITERAL_RE = re.compile(r"[^*?\[]+")
+_PREFIX_GLOB_RE = re.compile(r"[^*?\[]+\*")
+_SUFFIX_GLOB_RE = re.compile(r"\*[^*?\[]+")
 
 
 def parse_args():
@@ -34,6 +76,17 @@ def parse_args():
     )
     p.add_argument("--exclude-urls", default="", help="Newline separated glob patterns")
     p.add_argument("--filter-urls", default="", help="Newline separated substrings")
+    p.add_argument(
+        "--early-stop",
+        type=int,
+        default=0,
+        help="Stop reading a feed after N consecutive stale entries (0 disables)",
+    )
+    p.add_argument(
+        "--cache-dir",
+        default="",
+        help="Directory for the persistent HTTP cache (in-memory if empty)",
+    )
     return p.parse_args()
 
 
@@ -57,90 +110,266 @@ def parse_since(amount: int, unit: str) -> datetime:
     return now - relativedelta(**{unit + "s": amount})
 
 
+def init_session(cache_dir: str = ""):
+    """Switch feed fetches to a caching session, persisted in `cache_dir` if given.
+
+    Cached feeds are never served as-is: every fetch is revalidated with
+    If-None-Match/If-Modified-Since (or refetched if the feed has no validators),
+    ignoring the server's max-age, so a new post is never hidden by an old copy.
+    """
+    global SESSION
+    options = {
+        "expire_after": requests_cache.EXPIRE_IMMEDIATELY,
+        "cache_control": False,
+    }
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        SESSION = requests_cache.CachedSession(
+            os.path.join(cache_dir, "http_cache"), backend="sqlite", **options
+        )
+    else:
+        SESSION = requests_cache.CachedSession(backend="memory", **options)
+
+
 def fetch_feed(url: str):
-    r = requests.get(url, timeout=30)
+    global HTTP_CACHE_UPDATED
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
+    if not getattr(r, "from_cache", False) and (
+        "ETag" in r.headers or "Last-Modified" in r.headers
+    ):
+        HTTP_CACHE_UPDATED = True
     return r.content
 
 
-def extract_urls(root_url: str, since_ago: datetime):
+def parse_lastmod(text: str):
     """
-    Fetch and parse sitemap(s) or RSS feeds, returning URLs modified since `since_ago`,
-    sorted from freshest to oldest.
+    Parse a sitemap/Atom (ISO 8601) or RSS (RFC 822) date into an aware datetime.
+    Naive values are assumed to be UTC. Returns None if the value can't be parsed.
     """
-    # tree = sitemap_tree_for_homepage(root_url)
-    tree = SitemapFetcher(url=root_url, recursion_level=0).sitemap()
-    results = []
-
-    for page in tree.all_pages():
-        url = page.url
-        lastmod = None
-        if page.last_modified:
-            lastmod = page.last_modified
-        elif page.news_story and page.news_story.publish_date:
-            lastmod = page.news_story.publish_date
-
-        if lastmod:
-            # If lastmod is date-only (time is 00:00:00), compare only date part
-            if (
-                lastmod.hour == 0
-                and lastmod.minute == 0
-                and lastmod.second == 0
-                and lastmod.microsecond == 0
-            ):
-                if lastmod.date() > since_ago.date():
-                    results.append((lastmod, url))
-            else:
-                if lastmod > since_ago:
-                    results.append((lastmod, url))
+    # sitemaps may pretty-print <lastmod>, and ciso8601 rejects surrounding whitespace
+    text = text.strip()
+    try:
+        lastmod = parse_iso_datetime(text)
+    except ValueError:
+        try:
+            lastmod = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if lastmod.tzinfo is None:
+        lastmod = lastmod.replace(tzinfo=timezone.utc)
+    return lastmod
 
-    # sort newest -> oldest
-    results.sort(key=lambda tup: tup[0], reverse=True)
 
-    return [url for _, url in results]
+def is_fresh(lastmod: datetime, since_ago: datetime) -> bool:
+    # If lastmod is date-only (time is 00:00:00), compare only date part
+    if (
+        lastmod.hour == 0
+        and lastmod.minute == 0
+        and lastmod.second == 0
+        and lastmod.microsecond == 0
+    ):
+        return lastmod.date() > since_ago.date()
+    return lastmod > since_ago
+
 
+def _entry_url_and_date(elem):
+    """Return (url, date text) for a sitemap <url>, RSS <item> or Atom <entry> element."""
+    if elem.tag == SITEMAP_NS + "url":
+        url = elem.findtext(SITEMAP_NS + "loc")
+        date = elem.findtext(SITEMAP_NS + "lastmod") or elem.findtext(
+            f"{NEWS_NS}news/{NEWS_NS}publication_date"
+        )
+    elif elem.tag == "item":
+        url = elem.findtext("link")
+        date = elem.findtext("pubDate")
+    else:
+        link = elem.find(f"{ATOM_NS}link[@rel='alternate']")
+        if link is None:
+            link = elem.find(ATOM_NS + "link")
+        url = link.get("href") if link is not None else None
+        date = elem.findtext(ATOM_NS + "published") or elem.findtext(
+            ATOM_NS + "updated"
+        )
+    return url, date
 
-def should_exclude(url: str, patterns: list[str]) -> bool:
-    return any(fnmatch.fnmatch(url, pat) for pat in patterns)
 
+def iter_urls(
+    feed_url: str,
+    since_ago: datetime,
+    early_stop: int = 0,
+    visited: set | None = None,
+    depth: int = 0,
+):
+    """
+    Stream a sitemap (or sitemap index), RSS or Atom feed, yielding (lastmod, url)
+    for every entry modified since `since_ago`. Elements are released as soon as they
+    are processed, so memory use doesn't grow with the size of the feed.
+
+    If `early_stop` is set, stop reading a document after that many consecutive
+    stale entries. Only use it for feeds ordered newest first.
 
-def should_filter(url: str, filters: list[str]) -> bool:
+    Child sitemaps that can't be fetched or parsed are skipped, as are ones already
+    visited or nested deeper than MAX_SITEMAP_DEPTH.
+    """
+    if visited is None:
+        visited = set()
+    visited.add(feed_url)
+
+    data = fetch_feed(feed_url)
+    if data[:2] == b"\x1f\x8b":  # gzipped sitemap (sitemap.xml.gz)
+        stream = gzip.GzipFile(fileobj=io.BytesIO(data))
+    else:
+        stream = io.BytesIO(data)
+
+    stale_streak = 0
+    for _, elem in etree.iterparse(
+        stream, events=("end",), tag=FEED_TAGS, resolve_entities=False
+    ):
+        if elem.tag == SITEMAP_NS + "sitemap":
+            loc = (elem.findtext(SITEMAP_NS + "loc") or "").strip()
+            if loc and loc not in visited:
+                if depth >= MAX_SITEMAP_DEPTH:
+                    print(f"Skipping {loc}: sitemaps nested too deep", file=sys.stderr)
+                else:
+                    try:
+                        yield from iter_urls(
+                            loc, since_ago, early_stop, visited, depth + 1
+                        )
+                    except (requests.RequestException, etree.XMLSyntaxError) as e:
+                        print(f"Skipping sitemap {loc}: {e}", file=sys.stderr)
+        else:
+            url, date = _entry_url_and_date(elem)
+            lastmod = parse_lastmod(date) if date else None
+            if url and lastmod:
+                if is_fresh(lastmod, since_ago):
+                    stale_streak = 0
+                    yield lastmod, url.strip()
+                else:
+                    stale_streak += 1
+                    if early_stop and stale_streak >= early_stop:
+                        print(
+                            f"Stopping {feed_url} after {stale_streak} stale entries",
+                            file=sys.stderr,
+                        )
+                        break
+
+        # free the processed element and everything parsed before it
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def extract_urls(root_url: str, since_ago: datetime, early_stop: int = 0):
+    """
+    Fetch and parse sitemap(s) or RSS feeds, yielding (lastmod, url) once per URL
+    modified since `since_ago`, in feed order.
+    """
+    seen = set()
+    for lastmod, url in iter_urls(root_url, since_ago, early_stop):
+        if url in seen:
+            continue
+        seen.add(url)
+        yield lastmod, url
+
+
+def compile_excludes(patterns: list[str]):
+    """
+    Split glob patterns into (exact, prefixes, suffixes, glob_re).
+    Patterns that are literal on one side (e.g. "https://site.com/tags/*" or "*.pdf")
+    are checked with plain string comparison; only real globs go through the regex.
+    """
+    exact, prefixes, suffixes, globs = set(), [], [], []
+    for pat in patterns:
+        if _LITERAL_RE.fullmatch(pat):
+            exact.add(pat)
+        elif _PREFIX_GLOB_RE.fullmatch(pat):
+            prefixes.append(pat[:-1])
+        elif _SUFFIX_GLOB_RE.fullmatch(pat):
+            suffixes.append(pat[1:])
+        else:
+            globs.append(pat)
+    glob_re = (
+        re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+        if globs
+        else None
+    )
+    return frozenset(exact), tuple(prefixes), tuple(suffixes), glob_re
+
+
+def compile_filters(filters: list[str]):
+    """
+    Build a matcher returning True if a URL contains any of `filters`, or None if empty.
+    Many filters are matched with an Aho-Corasick automaton, so the cost of a match
+    doesn't grow with their number; a few are cheaper as a regex alternation.
+    """
     if not filters:
+        return None
+    if ahocorasick is not None and len(filters) > AHOCORASICK_MIN_FILTERS:
+        automaton = ahocorasick.Automaton()
+        for f in filters:
+            automaton.add_word(f, f)
+        automaton.make_automaton()
+        return lambda url: next(automaton.iter(url), None) is not None
+    filter_re = re.compile("|".join(map(re.escape, filters)))
+    return lambda url: filter_re.search(url) is not None
+
+
+def should_exclude(url: str, excludes) -> bool:
+    exact, prefixes, suffixes, glob_re = excludes
+    return (
+        url in exact
+        or url.startswith(prefixes)
+        or url.endswith(suffixes)
+        or (glob_re is not None and glob_re.match(url) is not None)
+    )
+
+
+def should_filter(url: str, matcher) -> bool:
+    if matcher is None:
         return True
-    return any(f in url for f in filters)
+    return matcher(url)
 
 
-def gha_output(name: str, value: str):
-    """Append a multi-line output to GITHUB_OUTPUT file."""
+def gha_output(name: str, lines):
+    """Append a multi-line output, one item per line, to GITHUB_OUTPUT file."""
     path = os.environ.get("GITHUB_OUTPUT")
     if not path:
         return  # running locally, just ignore
-    with open(path, "a") as f:
-        f.write(f"{name}<<EOF\n{value}\nEOF\n")
+    with open(path, "a", buffering=1 << 16) as f:
+        f.write(f"{name}<<EOF\n")
+        f.writelines(f"{line}\n" for line in lines)
+        f.write("EOF\n")
 
 
 def main():
     args = parse_args()
+    init_session(args.cache_dir)
     since_ago = parse_since(args.since, args.since_unit)
-    candidates = set(extract_urls(args.feed_url, since_ago))
+    # sort newest -> oldest
+    found = extract_urls(args.feed_url, since_ago, args.early_stop)
+    candidates = [url for _, url in sorted(found, key=lambda tup: tup[0], reverse=True)]
 
     exclude_patterns = [p.strip() for p in args.exclude_urls.splitlines() if p.strip()]
     filter_patterns = [p.strip() for p in args.filter_urls.splitlines() if p.strip()]
+    excludes = compile_excludes(exclude_patterns)
+    url_filter = compile_filters(filter_patterns)
 
     processed = []
-    for url in sorted(candidates):
-        if should_exclude(url, exclude_patterns):
+    for url in candidates:
+        if should_exclude(url, excludes):
             print(f"Excluding URL: {url}", file=sys.stderr)
             continue
-        if not should_filter(url, filter_patterns):
+        if not should_filter(url, url_filter):
             print(f"Skipping (no filter match): {url}", file=sys.stderr)
             continue
         print(f"Processing URL: {url}", file=sys.stderr)
         processed.append(url)
 
     # Output both lists for GitHub Actions
-    gha_output("latest-urls", "\n".join(sorted(candidates)))
-    gha_output("processed-urls", "\n".join(processed))
+    gha_output("latest-urls", candidates)
+    gha_output("processed-urls", processed)
+    gha_output("http-cache-updated", ["true" if HTTP_CACHE_UPDATED else "false"])
 
 
 if __name__ == "__main__":
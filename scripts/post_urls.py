@@ -1,63 +1,209 @@
 #!/usr/bin/env python3
 import argparse
+import io
+import json
 import os
 import re
 import shutil
+import string
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
+from html.parser import HTMLParser
+from itertools import islice
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+FETCH_CACHE_SIZE = 128
+PREFETCH_WORKERS = 8
+
+# One shared session, so connections (and TLS handshakes) are reused across requests
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# crosspost flag -> alternative sets of environment variables enabling it
+NETWORK_CREDENTIALS = {
+    "--twitter": (
+        ("TWITTER_ACCESS_TOKEN_KEY", "TWITTER_ACCESS_TOKEN_SECRET"),
+        ("TWITTER_API_CONSUMER_KEY", "TWITTER_API_CONSUMER_SECRET"),
+    ),
+    "--mastodon": (("MASTODON_HOST", "MASTODON_ACCESS_TOKEN"),),
+    "--bluesky": (("BLUESKY_HOST", "BLUESKY_IDENTIFIER", "BLUESKY_PASSWORD"),),
+    "--linkedin": (("LINKEDIN_ACCESS_TOKEN",),),
+    "--discord": (("DISCORD_BOT_TOKEN", "DISCORD_CHANNEL_ID"),),
+    "--discord-webhook": (("DISCORD_WEBHOOK_URL",),),
+    "--devto": (("DEVTO_API_KEY",),),
+    "--telegram": (("TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"),),
+    "--slack": (("SLACK_TOKEN", "SLACK_CHANNEL"),),
+}
+
+# Match {description} / {tags} with optional spaces inside the braces
+_DESC_RE = re.compile(r"\{ *description *\}")
+_TAGS_RE = re.compile(r"\{ *tags *\}")
+_PLACEHOLDER_RE = re.compile(r"\{ *(url|description|tags) *\}")
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+
+_LOG_LOCK = threading.Lock()
+
+
+def log(msg):
+    """Write one line to stdout; flushed once at the end of the run.
+
+    Each line is a single write under a lock, so lines from concurrent
+    workers never interleave.
+    """
+    with _LOG_LOCK:
+        sys.stdout.write(f"{msg}\n")
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=FETCH_CACHE_SIZE)
 def fetch_post(url):
     """Fetch and parse a URL, returning (resp, soup). Caches by URL."""
-    resp = requests.get(url, timeout=10)
+    resp = SESSION.get(url, timeout=10)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, "lxml")
     return resp, soup
 
 
+class _HeadDone(Exception):
+    pass
+
+
+class _HeadMetaParser(HTMLParser):
+    """Collect <meta> attributes, stopping as soon as the document head ends."""
+
+    def __init__(self):
+        super().__init__()
+        self.metas = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            raise _HeadDone
+        if tag == "meta":
+            self.metas.append(dict(attrs))
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            raise _HeadDone
+
+
+@lru_cache(maxsize=FETCH_CACHE_SIZE)
+def fetch_head_meta(url):
+    """Fetch only the <head> of a page, returning its <meta> attributes. Caches by URL.
+
+    The response is streamed and dropped once <body> starts, so the rest of the page
+    is neither downloaded nor parsed.
+    """
+    parser = _HeadMetaParser()
+    with SESSION.get(url, timeout=10, stream=True) as resp:
+        resp.raise_for_status()
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        try:
+            for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
+                parser.feed(chunk)
+        except _HeadDone:
+            pass
+    return tuple(parser.metas)
+
+
+def fetch_page_meta(url):
+    """Return the <meta> attributes of a page, downloading it only once.
+
+    When content scanning needs the whole page anyway, they're taken from the cached
+    full parse; otherwise only the page head is fetched.
+    """
+    if not _SCAN_CONTENT:
+        return fetch_head_meta(url)
+    _, soup = fetch_post(url)
+    return tuple(dict(m.attrs) for m in (soup.head or soup).find_all("meta"))
+
+
+def _safe_fetch(url):
+    try:
+        fetch_page_meta(url)
+    except Exception:
+        pass  # errors are reported later, when the post is actually processed
+
+
+def prefetch_posts(urls):
+    """Fetch posts in parallel to warm the caches before processing."""
+    # don't prefetch more than the cache can hold, later entries would evict earlier ones
+    urls = list(urls)[:FETCH_CACHE_SIZE]
+    if not urls:
+        return
+    with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(urls))) as ex:
+        list(ex.map(_safe_fetch, urls))
+
+
 def parse_args():
     p = argparse.ArgumentParser()
     p.add_argument("--urls", required=True)
     p.add_argument("--limit", type=int, required=True)
-    p.add_argument("--failure-strategy", choices=["ignore", "error"], default="ignore")
+    p.add_argument(
+        "--failure-strategy",
+        type=str.lower,
+        choices=["ignore", "fail", "error"],  # "error" is an alias of "fail"
+        default="ignore",
+    )
     p.add_argument("--dry-run", default=False, action="store_true")
     p.add_argument("--message", default="{url}")
+    p.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of URLs to post in parallel (above 1, posting order isn't kept)",
+    )
     return p.parse_args()
 
 
 def post_webmention_to_endpoint(source, endpoint, target):
     """Send webmention to a specific endpoint."""
     data = {"source": source, "target": target}
-    r = requests.post(endpoint, data=data, timeout=10)
+    r = SESSION.post(endpoint, data=data, timeout=10)
     if r.status_code in (200, 201, 202):
         return True, f"Webmention sent via {endpoint}"
     else:
         return False, f"Webmention failed: {r.status_code} {r.text}"
 
 
+@lru_cache(maxsize=FETCH_CACHE_SIZE)
+def discover_webmention_endpoint(target):
+    """Find the webmention endpoint advertised by target. Returns absolute URL or None."""
+    resp = SESSION.get(target, timeout=10)
+    resp.raise_for_status()
+    # Only <link> and <a> elements can advertise an endpoint, skip building the rest
+    soup = BeautifulSoup(resp.text, "lxml", parse_only=SoupStrainer(["link", "a"]))
+    for tag in soup.find_all(["link", "a"], rel=True):
+        rels = tag.get("rel")
+        if isinstance(rels, str):
+            rels = rels.split()
+        if rels and any(r.lower() == "webmention" for r in rels):
+            endpoint = tag.get("href")
+            if endpoint:
+                return requests.compat.urljoin(target, endpoint)
+    return None
+
+
 def send_webmention(source, target):
     """Send a webmention from source to target by discovering endpoint. Returns (success, message)."""
     try:
-        _, soup = fetch_post(target)
-        endpoint = None
-        for tag in soup.find_all(["link", "a"], rel=True):
-            rels = tag.get("rel")
-            if isinstance(rels, str):
-                rels = rels.split()
-            if rels and any(r.lower() == "webmention" for r in rels):
-                endpoint = tag.get("href")
-                if endpoint:
-                    break
+        endpoint = discover_webmention_endpoint(target)
         if not endpoint:
             return False, f"No webmention endpoint found for {target}"
-        endpoint = requests.compat.urljoin(target, endpoint)
         return post_webmention_to_endpoint(source, endpoint, target)
     except Exception as e:
         return False, f"Webmention error for {target}: {e}"
@@ -70,26 +216,24 @@ def notify_webmention_hosts(source_url, targets, endpoint=None, dry_run=False):
     Otherwise, discover endpoint from each target.
     """
     for target in targets:
-        print(f"🌐 Notifying webmention target: source={source_url} target={target}")
+        log(f"🌐 Notifying webmention target: source={source_url} target={target}")
         if dry_run:
-            print(f"✅ Would send webmention: source={source_url} target={target}")
+            log(f"✅ Would send webmention: source={source_url} target={target}")
             continue
         # Only check that source is deployed (fetchable)
         try:
-            fetch_post(source_url)
+            fetch_page_meta(source_url)
         except Exception as e:
-            print(
-                f"⚠️ Could not fetch source {source_url} before notifying {target}: {e}"
-            )
+            log(f"⚠️ Could not fetch source {source_url} before notifying {target}: {e}")
             continue
         if endpoint:
             success, msg = post_webmention_to_endpoint(source_url, endpoint, target)
         else:
             success, msg = send_webmention(source_url, target)
         if success:
-            print(f"✅ {msg}")
+            log(f"✅ {msg}")
         else:
-            print(f"⚠️ {msg}")
+            log(f"⚠️ {msg}")
 
 
 def send_webmentions_to_external_links(source_url, dry_run=False):
@@ -99,9 +243,7 @@ def send_webmentions_to_external_links(source_url, dry_run=False):
         # Find e-content (IndieWeb microformat)
         e_content = soup.find(class_="e-content")
         if not e_content:
-            print(
-                f"ℹ️ No e-content found in {source_url}, skipping dynamic webmentions."
-            )
+            log(f"ℹ️ No e-content found in {source_url}, skipping dynamic webmentions.")
             return
         # Find all external links
         links = set()
@@ -110,71 +252,69 @@ def send_webmentions_to_external_links(source_url, dry_run=False):
             if href.startswith("http") and not href.startswith(source_url):
                 links.add(href)
         if not links:
-            print(f"ℹ️ No external links found in e-content of {source_url}.")
+            log(f"ℹ️ No external links found in e-content of {source_url}.")
             return
         for target in sorted(links):
-            print(
+            log(
                 f"🌐 Sending webmention to external link: source={source_url} target={target}"
             )
             if dry_run:
-                print(f"✅ Would send webmention: source={source_url} target={target}")
+                log(f"✅ Would send webmention: source={source_url} target={target}")
                 continue
             success, msg = send_webmention(source_url, target)
             if success:
-                print(f"✅ {msg}")
+                log(f"✅ {msg}")
             else:
-                print(f"⚠️ {msg}")
-    except Exception as e:
-        print(f"⚠️ Error scanning {source_url} for dynamic webmentions: {e}")
-
-
-def extract_description(url):
-    try:
-        _, soup = fetch_post(url)
-        meta = soup.find("meta", attrs={"name": "description"})
-        if meta and meta.get("content"):
-            return meta["content"]
+                log(f"⚠️ {msg}")
     except Exception as e:
-        print(f"⚠️ Could not fetch description from {url}: {e}")
-    return ""
+        log(f"⚠️ Error scanning {source_url} for dynamic webmentions: {e}")
 
 
-def extract_og_tags(url):
+def extract_meta(url):
+    """Extract meta description and article:tag values from a page. Returns (description, tags)."""
+    description = ""
+    tags = set()
     try:
-        _, soup = fetch_post(url)
-        og_tags = set()
-        for tag in soup.find_all("meta"):
-            if tag.get("property", "").startswith("article:tag"):
-                og_tags.add(tag.get("content", ""))
-        og_tags = {t for t in og_tags if t}  # remove empty tags
-        return og_tags
+        for meta in fetch_page_meta(url):
+            content = meta.get("content")
+            if not content:
+                continue
+            if not description and meta.get("name") == "description":
+                description = content
+            elif (meta.get("property") or "").startswith("article:tag"):
+                tags.add(content)
     except Exception as e:
-        print(f"⚠️ Could not fetch OG tags from {url}: {e}")
-    return {}
+        log(f"⚠️ Could not fetch metadata from {url}: {e}")
+    return description, tags
 
 
 def extract_og_image(url):
     """Extract og:image URL and alt text from a page. Returns (image_url, alt_text) or (None, None)."""
     try:
-        _, soup = fetch_post(url)
-        meta = soup.find("meta", attrs={"property": "og:image"})
-        if meta and meta.get("content"):
-            image_url = meta["content"]
+        metas = fetch_page_meta(url)
+        image_url = next(
+            (m.get("content") for m in metas if m.get("property") == "og:image"), None
+        )
+        if image_url:
             # Try to get og:image:alt
-            alt_meta = soup.find("meta", attrs={"property": "og:image:alt"})
-            alt_text = (
-                alt_meta["content"] if alt_meta and alt_meta.get("content") else ""
+            alt_text = next(
+                (
+                    m.get("content")
+                    for m in metas
+                    if m.get("property") == "og:image:alt"
+                ),
+                None,
             )
-            return image_url, alt_text
+            return image_url, alt_text or ""
     except Exception as e:
-        print(f"⚠️ Could not fetch og:image from {url}: {e}")
+        log(f"⚠️ Could not fetch og:image from {url}: {e}")
     return None, None
 
 
 def download_image(image_url, temp_dir):
     """Download an image to a temp directory. Returns the local file path or None."""
     try:
-        resp = requests.get(image_url, timeout=30)
+        resp = SESSION.get(image_url, timeout=30)
         resp.raise_for_status()
 
         # Map MIME types to extensions (Content-Type is primary source)
@@ -209,106 +349,162 @@ def download_image(image_url, temp_dir):
             f.write(resp.content)
         return filepath
     except Exception as e:
-        print(f"⚠️ Could not download image {image_url}: {e}")
+        log(f"⚠️ Could not download image {image_url}: {e}")
     return None
 
 
+@lru_cache(maxsize=8)
+def normalize_message(message):
+    """Collapse placeholders like "{ tags }" to "{tags}", so str.format can fill them."""
+    return _PLACEHOLDER_RE.sub(r"{\1}", message)
+
+
 def message_needs_description(message):
-    # Matches {description} with optional spaces inside the braces
-    return re.search(r"\{ *description *\}", message) is not None
+    return _DESC_RE.search(message) is not None
 
 
 def message_needs_tags(message):
-    # Matches {tags} with optional spaces inside the braces
-    return re.search(r"\{ *tags *\}", message) is not None
-
-
-def build_crosspost_cmd(message, url, image_path=None, image_alt=None):
-    cmd = ["npx", "crosspost"]
-
-    # Twitter
-    if (
-        os.getenv("TWITTER_ACCESS_TOKEN_KEY")
-        and os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-    ) or (
-        os.getenv("TWITTER_API_CONSUMER_KEY")
-        and os.getenv("TWITTER_API_CONSUMER_SECRET")
-    ):
-        cmd.append("--twitter")
-
-    # Mastodon
-    if os.getenv("MASTODON_HOST") and os.getenv("MASTODON_ACCESS_TOKEN"):
-        cmd.append("--mastodon")
-
-    # Bluesky
-    if (
-        os.getenv("BLUESKY_HOST")
-        and os.getenv("BLUESKY_IDENTIFIER")
-        and os.getenv("BLUESKY_PASSWORD")
-    ):
-        cmd.append("--bluesky")
-
-    # LinkedIn
-    if os.getenv("LINKEDIN_ACCESS_TOKEN"):
-        cmd.append("--linkedin")
-
-    # Discord (bot)
-    if os.getenv("DISCORD_BOT_TOKEN") and os.getenv("DISCORD_CHANNEL_ID"):
-        cmd.append("--discord")
-
-    # Discord (webhook)
-    if os.getenv("DISCORD_WEBHOOK_URL"):
-        cmd.append("--discord-webhook")
-
-    # Dev.to
-    if os.getenv("DEVTO_API_KEY"):
-        cmd.append("--devto")
-
-    # Telegram
-    if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_CHAT_ID"):
-        cmd.append("--telegram")
-
-    # Slack
-    if os.getenv("SLACK_TOKEN") and os.getenv("SLACK_CHANNEL"):
-        cmd.append("--slack")
-
-    # Prepare description if needed
-    description = ""
-    if message_needs_description(message):
-        description = extract_description(url)
-
-    # Prepare og tags if needed
-    if message_needs_tags(message):
-        tags = extract_og_tags(url)
-        if tags:
-            # Format as hashtags
-            normalized_tags = {re.sub("[^0-9a-zA-Z]+", "", t) for t in tags}
-            hashtags = " ".join(sorted({f"#{t}" for t in normalized_tags if t}))
-            message = re.sub(r"\{ *tags *\}", hashtags, message)
-        else:
-            message = re.sub(r"\{ *tags *\}", "", message)
+    return _TAGS_RE.search(message) is not None
 
-    # Format message with url and description
-    formatted_message = message.format(url=url, description=description)
-    cmd.append(formatted_message)
 
-    # Add image if available
-    if image_path:
-        cmd.extend(["--image", image_path])
-        if image_alt:
-            cmd.extend(["--image-alt", image_alt])
+@lru_cache(maxsize=8)
+def compile_message(message):
+    """Parse a normalized message template once, returning a function of its fields.
+
+    Formatting a URL then only joins literal text with field values. Templates using
+    format specs, conversions or unknown fields fall back to str.format_map.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(message):
+        if spec or conversion or field not in (None, "url", "description", "tags"):
+            return message.format_map
+        parts.append((literal, field))
 
-    return cmd
+    def render(fields):
+        return "".join(
+            literal if field is None else literal + fields[field]
+            for literal, field in parts
+        )
+
+    return render
+
+
+def _resolve_crosspost():
+    """Return the command prefix used to run crosspost.
+
+    crosspost posts a single message per invocation, so URLs can't be batched into
+    one process. Calling the installed binary directly at least skips npx package
+    resolution on every post; npx is only used when crosspost isn't on PATH.
+    """
+    path = shutil.which("crosspost")
+    return (path,) if path else ("npx", "crosspost")
+
+
+CROSSPOST_CMD = _resolve_crosspost()
+
+
+def _detect_network_flags(env=os.environ):
+    """Return crosspost CLI flags for networks with complete credentials in `env`."""
+    return tuple(
+        flag
+        for flag, alternatives in NETWORK_CREDENTIALS.items()
+        if any(all(env.get(var) for var in variables) for variables in alternatives)
+    )
+
+
+# Environment doesn't change during a run, so credentials are only read once
+_ENABLED_FLAGS = _detect_network_flags()
+_SCAN_CONTENT = os.getenv("WEBMENTION_SCAN_CONTENT", "false").lower() == "true"
+
+_CMD_PREFIX = (*CROSSPOST_CMD, *_ENABLED_FLAGS)
+
+
+def build_crosspost_cmd(
+    message,
+    url,
+    needs_description,
+    needs_tags,
+    image_path=None,
+    image_alt=None,
+):
+    # Prepare description and og tags if needed (single fetch & parse)
+    description, tags = "", set()
+    if needs_description or needs_tags:
+        description, tags = extract_meta(url)
+
+    # Format as hashtags
+    hashtags = ""
+    if needs_tags and tags:
+        normalized_tags = {_NON_ALNUM_RE.sub("", t) for t in tags}
+        hashtags = " ".join(sorted({f"#{t}" for t in normalized_tags if t}))
+
+    # Format message with url, description and tags in a single pass
+    render = compile_message(normalize_message(message))
+    formatted_message = render(
+        {"url": url, "description": description, "tags": hashtags}
+    )
+
+    # Add image if available
+    if not image_path:
+        return [*_CMD_PREFIX, formatted_message]
+    if not image_alt:
+        return [*_CMD_PREFIX, formatted_message, "--image", image_path]
+    return [
+        *_CMD_PREFIX,
+        formatted_message,
+        "--image",
+        image_path,
+        "--image-alt",
+        image_alt,
+    ]
+
+
+def load_posted(path):
+    """Load the set of already posted URLs from a JSON state file."""
+    if not path or not os.path.exists(path):
+        return set()
+    try:
+        with open(path) as f:
+            return set(json.load(f))
+    except (OSError, TypeError, ValueError) as e:
+        log(f"⚠️ Could not read posted state {path}: {e}")
+        return set()
+
+
+def save_posted(path, posted):
+    """Store the set of posted URLs in a JSON state file."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(sorted(posted), f, indent=2)
+
+
+def iter_new_urls(lines, posted):
+    """Yield unique, non-blank URLs from `lines` that aren't in `posted`."""
+    seen = set()
+    for line in lines:
+        url = line.strip()
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        if url in posted:
+            log(f"⏭️ Already posted, skipping {url}")
+            continue
+        yield url
 
 
 def main():
     args = parse_args()
-    limit = int(os.getenv("LIMIT", "0")) or None
-    failure_strategy = os.getenv("FAILURE_STRATEGY", "ignore").lower()
-
-    urls = args.urls.splitlines()
-    if limit:
-        urls = urls[:limit]
+    limit = args.limit or None  # 0 means no limit
+    fail_fast = args.failure_strategy in ("fail", "error")
+
+    # Skip duplicates and URLs already posted in previous runs, reading only
+    # as many lines as needed to reach the limit
+    posted_state = os.getenv("POSTED_STATE", "").strip()
+    posted = load_posted(posted_state)
+    urls = list(islice(iter_new_urls(io.StringIO(args.urls), posted), limit))
+    if not urls:
+        log("ℹ️ No new URLs to post.")
+        return
 
     # Parse webmention configuration
     webmention_endpoint = os.getenv("WEBMENTION_ENDPOINT", "").strip()
@@ -317,84 +513,134 @@ def main():
     )
     webmention_target_hosts = [h.strip() for h in webmention_target_hosts if h.strip()]
 
-    scan_content_enabled = (
-        os.getenv("WEBMENTION_SCAN_CONTENT", "false").lower() == "true"
-    )
+    scan_content_enabled = _SCAN_CONTENT
 
     # Check if social networks are configured
-    test_cmd = build_crosspost_cmd(args.message, "https://example.com")
-    social_networks_enabled = len(test_cmd) > 2  # more than ["npx", "crosspost", url]
+    social_networks_enabled = bool(_ENABLED_FLAGS)
 
     # Check if webmentions are configured
     webmentions_enabled = bool(webmention_target_hosts) or scan_content_enabled
 
     # Abort only if neither social networks nor webmentions are configured
     if not social_networks_enabled and not webmentions_enabled:
-        print("❌ No social networks or webmentions configured. Aborting.")
+        log("❌ No social networks or webmentions configured. Aborting.")
         sys.exit(1)
 
+    message = normalize_message(args.message)
+    needs_description = message_needs_description(message)
+    needs_tags = message_needs_tags(message)
+
+    # Fetch all posts up front, so per-URL metadata lookups hit the cache
+    prefetch_posts(urls)
+
     # Create a temp directory for downloaded images
     temp_dir = tempfile.mkdtemp(prefix="crosspost-")
 
+    # Set on the first failure with failure-strategy `fail`, so queued URLs are skipped
+    stop = threading.Event()
+
+    def process_url(url):
+        """Post a single URL and send its webmentions.
+
+        Returns False if posting failed, None if skipped after an earlier failure.
+        """
+        if stop.is_set():
+            return None
+        ok = True
+        # Extract image for this post
+        image_path = None
+        image_alt = None
+        image_url, image_alt_text = extract_og_image(url)
+        if image_url:
+            log(f"🖼️ Found image for {url}: {image_url}")
+            image_path = download_image(image_url, temp_dir)
+            image_alt = image_alt_text
+
+        # Crosspost to social networks (if configured)
+        if social_networks_enabled:
+            cmd = build_crosspost_cmd(
+                message,
+                url,
+                needs_description,
+                needs_tags,
+                image_path=image_path,
+                image_alt=image_alt,
+            )
+            if args.dry_run:
+                log(f"✅ Would post {url} with command: {' '.join(cmd)}")
+            else:
+                log(f"🚀 Posting {url} ...")
+                try:
+                    # Capture crosspost's output, so it is logged in one piece
+                    # instead of interleaving with other workers
+                    result = subprocess.run(
+                        cmd, check=True, capture_output=True, text=True
+                    )
+                    posted.add(url)
+                    output = f"{result.stdout}{result.stderr}".rstrip()
+                    if output:
+                        log(output)
+                except subprocess.CalledProcessError as e:
+                    log(f"⚠️ Failed to post {url}: {e}\n{e.stdout}{e.stderr}".rstrip())
+                    if fail_fast:
+                        stop.set()
+                        return False
+                    # Continue with webmentions even if crosspost fails
+                    ok = False
+
+        # Send webmentions (if configured)
+        if webmentions_enabled:
+            if args.dry_run:
+                # Shoot-and-forget webmentions
+                if webmention_target_hosts:
+                    notify_webmention_hosts(
+                        url,
+                        webmention_target_hosts,
+                        endpoint=webmention_endpoint,
+                        dry_run=True,
+                    )
+                # Dynamic webmentions (only if enabled)
+                if scan_content_enabled:
+                    send_webmentions_to_external_links(url, dry_run=True)
+            else:
+                # Shoot-and-forget webmentions
+                if webmention_target_hosts:
+                    notify_webmention_hosts(
+                        url,
+                        webmention_target_hosts,
+                        endpoint=webmention_endpoint,
+                        dry_run=False,
+                    )
+                # Dynamic webmentions (scan e-content for external links, only if enabled)
+                if scan_content_enabled:
+                    send_webmentions_to_external_links(url, dry_run=False)
+                # Webmention-only setups have no crosspost to record, so remember
+                # the URL once its webmentions were sent
+                if not social_networks_enabled:
+                    posted.add(url)
+        return ok
+
     try:
-        for url in urls:
-            # Extract image for this post
-            image_path = None
-            image_alt = None
-            image_url, image_alt_text = extract_og_image(url)
-            if image_url:
-                print(f"🖼️ Found image for {url}: {image_url}")
-                image_path = download_image(image_url, temp_dir)
-                image_alt = image_alt_text
-
-            # Crosspost to social networks (if configured)
-            if social_networks_enabled:
-                cmd = build_crosspost_cmd(
-                    args.message, url, image_path=image_path, image_alt=image_alt
-                )
-                if args.dry_run:
-                    print(f"✅ Would post {url} with command: {' '.join(cmd)}")
-                else:
-                    print(f"🚀 Posting {url} ...")
-                    try:
-                        subprocess.run(cmd, check=True)
-                    except subprocess.CalledProcessError as e:
-                        print(f"⚠️ Failed to post {url}: {e}")
-                        if failure_strategy == "fail":
-                            sys.exit(1)
-                        else:
-                            # Continue with webmentions even if crosspost fails
-                            pass
-
-            # Send webmentions (if configured)
-            if webmentions_enabled:
-                if args.dry_run:
-                    # Shoot-and-forget webmentions
-                    if webmention_target_hosts:
-                        notify_webmention_hosts(
-                            url,
-                            webmention_target_hosts,
-                            endpoint=webmention_endpoint,
-                            dry_run=True,
-                        )
-                    # Dynamic webmentions (only if enabled)
-                    if scan_content_enabled:
-                        send_webmentions_to_external_links(url, dry_run=True)
-                else:
-                    # Shoot-and-forget webmentions
-                    if webmention_target_hosts:
-                        notify_webmention_hosts(
-                            url,
-                            webmention_target_hosts,
-                            endpoint=webmention_endpoint,
-                            dry_run=False,
-                        )
-                    # Dynamic webmentions (scan e-content for external links, only if enabled)
-                    if scan_content_enabled:
-                        send_webmentions_to_external_links(url, dry_run=False)
+        # Posting is I/O bound (HTTP + crosspost subprocess), so run a few URLs at once
+        workers = max(1, min(args.concurrency, len(urls) or 1))
+        failed = False
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(process_url, url) for url in urls]
+            for future in as_completed(futures):
+                if future.result() is False:
+                    failed = True
+                    if fail_fast:
+                        # Don't start posts still queued; running ones finish
+                        ex.shutdown(cancel_futures=True)
+                        break
+        if fail_fast and failed:
+            sys.exit(1)
     finally:
         # Clean up temp directory
         shutil.rmtree(temp_dir, ignore_errors=True)
+        if posted_state and not args.dry_run:
+            save_posted(posted_state, posted)
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":